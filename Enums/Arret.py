@@ -0,0 +1,8 @@
+from enum import Enum
+
+class Arret(Enum):
+    """Raison de l'arrêt d'une partie (Game.run)."""
+    TOURS = "tours"
+    EXTINCTION = "extinction"
+    PLATEAU = "plateau"
+    CIBLE = "cible"
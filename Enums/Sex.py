@@ -2,4 +2,12 @@ from enum import Enum
 
 class Sex(Enum):
     MALE = "Homme"
-    FEMALE = "Femme"
\ No newline at end of file
+    FEMALE = "Femme"
+
+# Codage entier du sexe, pour les moteurs qui stockent les humains dans des tableaux numpy
+SEXE_AUCUN = 0
+SEXE_MALE = 1
+SEXE_FEMALE = 2
+
+SEXE_VERS_CODE = {None: SEXE_AUCUN, Sex.MALE: SEXE_MALE, Sex.FEMALE: SEXE_FEMALE}
+CODE_VERS_SEXE = {code: sexe for sexe, code in SEXE_VERS_CODE.items()}
@@ -0,0 +1,286 @@
+# Game/equivalence.py
+"""
+Banc d'équivalence entre le moteur de référence (World.tick) et un moteur alternatif.
+
+Lancer : python -m Game.Equivalence --moteur ensemble --runs 2000
+
+Deux familles de vérifications, pour chaque taille de TAILLES :
+- invariants, à chaque tick et pour les deux moteurs : au plus un humain par case,
+  déplacement d'au plus une case (torus), âge +1, mort exactement à duree_vie ;
+  en plus, les deux moteurs partant du même état doivent avoir les mêmes survivants.
+- distributions : depuis un même état initial, on joue un tick `runs` fois avec
+  chaque moteur, puis on compare (test du khi-deux d'homogénéité) la case d'arrivée
+  de chaque humain et le nombre d'humains qui ont bougé. La case d'arrivée couvre
+  à la fois le choix de la direction et le tirage du gagnant en cas de conflit.
+"""
+import argparse
+import contextlib
+import copy
+import io
+import math
+import random
+from collections import Counter
+from typing import Dict, Hashable, List, Tuple
+
+from Models.World import World, PopulationDead
+from Models.Ensemble import Ensemble
+
+# identifiant de l'humain -> (x, y, age, duree_vie)
+Etat = Dict[int, Tuple[int, int, int, int]]
+
+# (largeur, hauteur, nb_humains) : du monde par défaut du README à une grille chargée
+TAILLES = [(7, 7, 15), (3, 3, 5), (20, 20, 150), (50, 50, 800)]
+
+
+# ---------------------------------------------------------------- Moteurs
+class MoteurReference:
+    """World.tick, un World par partie. Les identifiants suivent l'ordre de each_human au départ."""
+
+    def __init__(self, mondes: List[World]) -> None:
+        self.mondes = mondes
+        self.idents = [{id(h): i for i, h in enumerate(m.each_human())} for m in mondes]
+        self.morts = [False] * len(mondes)
+
+    def tick(self) -> None:
+        for b, monde in enumerate(self.mondes):
+            if self.morts[b]:
+                continue
+            try:
+                monde.tick()
+            except PopulationDead:
+                self.morts[b] = True
+
+    def etats(self) -> List[Etat]:
+        etats = []
+        for monde, idents in zip(self.mondes, self.idents):
+            etat: Etat = {}
+            for y, ligne in enumerate(monde.grille):
+                for x, h in enumerate(ligne):
+                    if h is None:
+                        continue
+                    if (h.coordoneeX, h.coordoneeY) != (x, y):
+                        raise AssertionError(f"coordonnées incohérentes pour l'humain en ({x},{y})")
+                    etat[idents[id(h)]] = (x, y, h.age, h.duree_vie)
+            etats.append(etat)
+        return etats
+
+    def eteints(self) -> List[bool]:
+        return list(self.morts)
+
+
+class MoteurEnsemble:
+    """Models.Ensemble : toutes les parties dans un seul lot vectorisé."""
+
+    def __init__(self, mondes: List[World], seed: int) -> None:
+        self.ens = Ensemble.depuis_mondes(mondes, seed=seed)
+
+    def tick(self) -> None:
+        self.ens.tick()
+
+    def etats(self) -> List[Etat]:
+        ens = self.ens
+        etats = []
+        for b in range(ens.nb_mondes):
+            ys, xs = ens.occupe[b].nonzero()
+            etats.append({
+                int(ens.ident[b, y, x]): (int(x), int(y), int(ens.age[b, y, x]), int(ens.duree_vie[b, y, x]))
+                for y, x in zip(ys, xs)
+            })
+        return etats
+
+    def eteints(self) -> List[bool]:
+        return [bool(e) for e in self.ens.eteints()]
+
+
+MOTEURS = {"ensemble": MoteurEnsemble}
+
+
+# ---------------------------------------------------------------- Invariants
+def _distance_torus(a: int, b: int, n: int) -> int:
+    d = abs(a - b) % n
+    return min(d, n - d)
+
+
+def verifier_invariants(avant: Etat, apres: Etat, largeur: int, hauteur: int) -> List[str]:
+    """Compare deux états consécutifs d'un même monde. Retourne la liste des violations."""
+    erreurs = []
+
+    cases = Counter((x, y) for x, y, _, _ in apres.values())
+    erreurs += [f"plusieurs humains sur la case {c}" for c, n in cases.items() if n > 1]
+
+    survivants_avant = {(x, y) for i, (x, y, age, vie) in avant.items() if age + 1 < vie}
+    for i, (x0, y0, age, vie) in avant.items():
+        if age + 1 >= vie:
+            if i in apres:
+                erreurs.append(f"humain {i} toujours vivant à {age + 1} ans (duree_vie={vie})")
+            continue
+        if i not in apres:
+            erreurs.append(f"humain {i} disparu à {age + 1} ans (duree_vie={vie})")
+            continue
+        x1, y1, age1, vie1 = apres[i]
+        if (age1, vie1) != (age + 1, vie):
+            erreurs.append(f"humain {i} : âge {age} -> {age1}, duree_vie {vie} -> {vie1}")
+        if not (0 <= x1 < largeur and 0 <= y1 < hauteur):
+            erreurs.append(f"humain {i} hors grille en ({x1},{y1})")
+        elif _distance_torus(x0, x1, largeur) > 1 or _distance_torus(y0, y1, hauteur) > 1:
+            erreurs.append(f"humain {i} : saut de ({x0},{y0}) à ({x1},{y1})")
+        elif (x1, y1) != (x0, y0) and (x1, y1) in survivants_avant:
+            erreurs.append(f"humain {i} entré sur une case occupée ({x1},{y1})")
+
+    erreurs += [f"humain {i} apparu" for i in apres.keys() - avant.keys()]
+    return erreurs
+
+
+def _monde_initial(largeur: int, hauteur: int, nb_humains: int, seed: int) -> World:
+    random.seed(seed)
+    monde = World(largeur, hauteur)
+    monde.remplir_grille(nb_humains, male_ratio=0.5)
+    return monde
+
+
+def comparer_invariants(nom_moteur: str, largeur: int, hauteur: int, nb_humains: int,
+                        tours: int, seed: int) -> List[str]:
+    """Joue `tours` ticks avec les deux moteurs depuis le même état et vérifie les invariants."""
+    monde = _monde_initial(largeur, hauteur, nb_humains, seed)
+    reference = MoteurReference([copy.deepcopy(monde)])
+    alternatif = MOTEURS[nom_moteur]([monde], seed)
+
+    erreurs = []
+    etats = {"reference": reference.etats()[0], nom_moteur: alternatif.etats()[0]}
+    if etats["reference"] != etats[nom_moteur]:
+        erreurs.append("états initiaux différents")
+
+    for t in range(1, tours + 1):
+        random.seed(seed + t)
+        reference.tick()
+        alternatif.tick()
+        nouveaux = {"reference": reference.etats()[0], nom_moteur: alternatif.etats()[0]}
+        for nom, etat in nouveaux.items():
+            erreurs += [f"tour {t}, {nom} : {e}" for e in verifier_invariants(etats[nom], etat, largeur, hauteur)]
+        if nouveaux["reference"].keys() != nouveaux[nom_moteur].keys():
+            erreurs.append(f"tour {t} : survivants différents")
+        if reference.eteints() != alternatif.eteints():
+            erreurs.append(f"tour {t} : extinction détectée par un seul moteur")
+        etats = nouveaux
+        if reference.eteints()[0]:
+            break
+    return erreurs
+
+
+# ---------------------------------------------------------------- Distributions
+def p_valeur_khi2(stat: float, ddl: int) -> float:
+    """P(X >= stat) pour X ~ khi-deux(ddl), approximation de Wilson-Hilferty."""
+    if ddl <= 0:
+        return 1.0
+    z = ((stat / ddl) ** (1 / 3) - (1 - 2 / (9 * ddl))) / math.sqrt(2 / (9 * ddl))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def khi2_homogeneite(a: Counter, b: Counter, effectif_min: int = 10) -> Tuple[float, int]:
+    """
+    Test du khi-deux d'homogénéité entre deux échantillons de catégories.
+    Les catégories trop rares (moins de effectif_min au total) sont regroupées.
+    Retourne (statistique, degrés de liberté).
+    """
+    rares: Hashable = ("rares",)
+    fusion_a, fusion_b = Counter(), Counter()
+    for c in a.keys() | b.keys():
+        cle = c if a[c] + b[c] >= effectif_min else rares
+        fusion_a[cle] += a[c]
+        fusion_b[cle] += b[c]
+
+    na, nb = sum(fusion_a.values()), sum(fusion_b.values())
+    if na == 0 or nb == 0:
+        return 0.0, 0
+    stat = 0.0
+    for c in fusion_a.keys() | fusion_b.keys():
+        total = fusion_a[c] + fusion_b[c]
+        for observe, n in ((fusion_a[c], na), (fusion_b[c], nb)):
+            attendu = total * n / (na + nb)
+            stat += (observe - attendu) ** 2 / attendu
+    return stat, len(fusion_a.keys() | fusion_b.keys()) - 1
+
+
+def _issues_un_tick(moteur, depart: Etat) -> Tuple[Dict[int, Counter], Counter]:
+    """Après un tick : case d'arrivée de chaque humain, et nombre de déplacements par partie."""
+    arrivees: Dict[int, Counter] = {i: Counter() for i in depart}
+    nb_deplacements: Counter = Counter()
+    for etat in moteur.etats():
+        bouges = 0
+        for i, (x, y, _, _) in etat.items():
+            arrivees[i][(x, y)] += 1
+            bouges += (x, y) != depart[i][:2]
+        nb_deplacements[bouges] += 1
+    return arrivees, nb_deplacements
+
+
+def comparer_distributions(nom_moteur: str, largeur: int, hauteur: int, nb_humains: int,
+                           runs: int, seed: int, alpha: float) -> List[str]:
+    """Joue `runs` fois un tick depuis le même état avec chaque moteur et compare les issues."""
+    monde = _monde_initial(largeur, hauteur, nb_humains, seed)
+    depart = MoteurReference([monde]).etats()[0]
+
+    reference = MoteurReference([copy.deepcopy(monde) for _ in range(runs)])
+    for r, m in enumerate(reference.mondes):
+        random.seed(seed + 1 + r)
+        m.tick()
+    alternatif = MOTEURS[nom_moteur]([monde] * runs, seed)
+    alternatif.tick()
+
+    arrivees_ref, deplacements_ref = _issues_un_tick(reference, depart)
+    arrivees_alt, deplacements_alt = _issues_un_tick(alternatif, depart)
+
+    tests = [(f"arrivée de l'humain {i}", arrivees_ref[i], arrivees_alt[i]) for i in depart]
+    tests.append(("nombre de déplacements", deplacements_ref, deplacements_alt))
+
+    # correction de Bonferroni : un test par humain + le nombre de déplacements
+    seuil = alpha / len(tests)
+    erreurs = []
+    for nom, a, b in tests:
+        stat, ddl = khi2_homogeneite(a, b)
+        p = p_valeur_khi2(stat, ddl)
+        if p < seuil:
+            erreurs.append(f"{nom} : khi2={stat:.1f}, ddl={ddl}, p={p:.2e} < {seuil:.1e}")
+    return erreurs
+
+
+# ---------------------------------------------------------------- CLI
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare un moteur alternatif au moteur de référence World.tick."
+    )
+    parser.add_argument("--moteur", choices=sorted(MOTEURS), default="ensemble",
+                        help="Moteur alternatif à comparer.")
+    parser.add_argument("--runs", type=int, default=2000,
+                        help="Nombre de parties pour comparer les distributions.")
+    parser.add_argument("--tours", type=int, default=100,
+                        help="Nombre de tours pour vérifier les invariants.")
+    parser.add_argument("--seed", type=int, default=125, help="Seed de départ.")
+    parser.add_argument("--alpha", type=float, default=0.001,
+                        help="Risque global des tests statistiques.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    echecs = 0
+    for largeur, hauteur, nb_humains in TAILLES:
+        taille = f"{largeur}x{hauteur}, {nb_humains} humains"
+        # World affiche beaucoup de traces : on les masque
+        with contextlib.redirect_stdout(io.StringIO()):
+            invariants = comparer_invariants(args.moteur, largeur, hauteur, nb_humains, args.tours, args.seed)
+            distributions = comparer_distributions(
+                args.moteur, largeur, hauteur, nb_humains, args.runs, args.seed, args.alpha
+            )
+        for titre, erreurs in (("invariants", invariants), ("distributions", distributions)):
+            print(f"[{'OK' if not erreurs else 'ÉCHEC'}] {taille} - {titre}")
+            for e in erreurs[:10]:
+                print(f"    {e}")
+            echecs += bool(erreurs)
+
+    if echecs:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
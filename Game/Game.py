@@ -1,39 +1,82 @@
 # Models/game.py
 import random
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 from Models.World import World, PopulationDead
+from Models.MondeDense import MondeDense
+from Enums.Arret import Arret
+
+
+@dataclass
+class Resultat:
+    """Résultat d'une partie : nombre de tours joués, raison de l'arrêt, vivants après chaque tour."""
+    tours_joues: int
+    raison: Arret
+    vivants: List[int] = field(default_factory=list)  # vivants[0] = état initial
+
+    @property
+    def eteinte(self) -> bool:
+        return self.raison == Arret.EXTINCTION
+
+    @property
+    def vivants_final(self) -> int:
+        return self.vivants[-1] if self.vivants else 0
+
 
 class Game:
     def __init__(self,
                  width: int,
                  height: int,
                  nb_humains: int,
-                 seed: Optional[int] = 42):
+                 seed: Optional[int] = 42,
+                 dense: bool = False):
         """
         Initialise la partie :
-        - crée un World(width x height)
+        - crée un World(width x height), ou un MondeDense si dense=True
+          (plusieurs humains par case)
         - remplit la grille avec nb_humains
         - fixe une seed pour rendre les tests reproductibles
         """
         if seed is not None:
             random.seed(seed)
 
-        self.world = World(width, height)
+        self.world = MondeDense(width, height, seed=seed) if dense else World(width, height)
         places = self.world.remplir_grille(nb_humains, male_ratio=0.5)
         if places < nb_humains:
             print(f"⚠️ Seulement {places}/{nb_humains} humains ont pu être placés.")
 
     def _compter_vivants(self) -> int:
         """Retourne le nombre d'humains encore vivants."""
-        return sum(1 for _ in self.world.each_human())
+        return self.world.nb_vivants
 
-    def run(self, tours: int = 4, afficher: bool = True) -> None:
-        """Lance la simulation pendant `tours` ticks."""
+    def run(self,
+            tours: int = 4,
+            afficher: bool = True,
+            *,
+            arret_plateau: Optional[int] = None,
+            cible_vivants: Optional[int] = None) -> Resultat:
+        """
+        Lance la simulation pendant au plus `tours` ticks et retourne un Resultat.
+        Arrêts anticipés (vérifiés après chaque tick) :
+        - extinction : plus aucun humain vivant (toujours actif)
+        - arret_plateau=n : population inchangée pendant n ticks consécutifs
+        - cible_vivants=k : population descendue à k vivants ou moins
+          (vérifié aussi avant le premier tick)
+        """
+        if arret_plateau is not None and arret_plateau < 1:
+            raise ValueError(f"arret_plateau doit être >= 1 (reçu {arret_plateau})")
+
+        vivants = self._compter_vivants()
+        historique = [vivants]
         if afficher:
             print("=== ÉTAT INITIAL ===")
             print(self.world._to_string())
-            print(f"Vivants: {self._compter_vivants()}\n")
+            print(f"Vivants: {vivants}\n")
+
+        if cible_vivants is not None and vivants <= cible_vivants:
+            return Resultat(tours_joues=0, raison=Arret.CIBLE, vivants=historique)
 
+        ticks_stables = 0
         for t in range(1, tours + 1):
 
             if afficher:
@@ -41,13 +84,25 @@ class Game:
             try:
                 self.world.tick()
             except PopulationDead:
-                raise SystemExit(0)
+                historique.append(0)
+                return Resultat(tours_joues=t, raison=Arret.EXTINCTION, vivants=historique)
+
+            precedent, vivants = vivants, self._compter_vivants()
+            historique.append(vivants)
             if afficher:
                 print(self.world._to_string())
-                print(f"Vivants: {self._compter_vivants()}\n")
+                print(f"Vivants: {vivants}\n")
+
+            ticks_stables = ticks_stables + 1 if vivants == precedent else 0
+            if arret_plateau is not None and ticks_stables >= arret_plateau:
+                return Resultat(tours_joues=t, raison=Arret.PLATEAU, vivants=historique)
+            if cible_vivants is not None and vivants <= cible_vivants:
+                return Resultat(tours_joues=t, raison=Arret.CIBLE, vivants=historique)
 
+        return Resultat(tours_joues=tours, raison=Arret.TOURS, vivants=historique)
 
 if __name__ == "__main__":
     # Petit test rapide
     game = Game(width=7, height=7, nb_humains=15, seed=125)
-    game.run(tours=60, afficher=True)
+    resultat = game.run(tours=60, afficher=True)
+    print(f"Fin après {resultat.tours_joues} tours ({resultat.raison.value})")
@@ -6,12 +6,15 @@ from tkinter import ttk
 from Enums.Sex import Sex
 from Game.Game import Game
 from Models.World import PopulationDead
+from .lod import RenduLOD, grilles_depuis_monde
 
 
 class SimulationApp:
     """Interface Tkinter pour visualiser la simulation sans modifier sa logique."""
 
     CELL_SIZE = 42
+    LOD_THRESHOLD = 40  # au-delà de 40 cases de côté, la grille passe en rendu agrégé
+    LOD_SIZE = 672  # taille du canevas (px) en rendu agrégé
     COLOR_BG = "#0f172a"
     COLOR_GRID = "#1e293b"
     COLOR_EMPTY = "#e2e8f0"
@@ -27,8 +30,15 @@ class SimulationApp:
         tours: int,
         interval_ms: int = 600,
         seed: Optional[int] = 125,
+        dense: bool = False,
     ) -> None:
-        self.game = Game(width=width, height=height, nb_humains=nb_humains, seed=seed)
+        self.game = Game(width=width, height=height, nb_humains=nb_humains, seed=seed, dense=dense)
+        # Rendu agrégé pour les grandes grilles, ou en mode dense
+        self.lod: Optional[RenduLOD] = None
+        if dense or max(width, height) > self.LOD_THRESHOLD:
+            self.lod = RenduLOD(
+                width, height, self.LOD_SIZE, self.COLOR_EMPTY, self.COLOR_MALE, self.COLOR_FEMALE
+            )
         self.max_tours = tours
         self.interval_ms = max(50, interval_ms)
         self.current_tour = 0
@@ -60,8 +70,11 @@ class SimulationApp:
         main.columnconfigure(1, weight=2)
         main.rowconfigure(1, weight=1)
 
-        canvas_width = self.game.world.largeur * self.CELL_SIZE
-        canvas_height = self.game.world.hauteur * self.CELL_SIZE
+        if self.lod is None:
+            canvas_width = self.game.world.largeur * self.CELL_SIZE
+            canvas_height = self.game.world.hauteur * self.CELL_SIZE
+        else:
+            canvas_width = canvas_height = self.LOD_SIZE
         self.canvas = tk.Canvas(
             main,
             width=canvas_width,
@@ -71,7 +84,10 @@ class SimulationApp:
         )
         self.canvas.grid(row=0, column=0, rowspan=2, sticky="nsew", padx=(0, 16))
 
-        self._create_cells()
+        if self.lod is None:
+            self._create_cells()
+        else:
+            self._create_lod_image()
 
         info_frame = ttk.Frame(main)
         info_frame.grid(row=0, column=1, sticky="new")
@@ -108,12 +124,20 @@ class SimulationApp:
         legend = ttk.Frame(parent)
         legend.pack(anchor="w", fill="x")
 
-        for color, label in (
-            (self.COLOR_MALE, "Homme"),
-            (self.COLOR_FEMALE, "Femme"),
-            (self.COLOR_UNKNOWN, "Sexe inconnu"),
-            (self.COLOR_EMPTY, "Case vide"),
-        ):
+        if self.lod is None:
+            entries = (
+                (self.COLOR_MALE, "Homme"),
+                (self.COLOR_FEMALE, "Femme"),
+                (self.COLOR_UNKNOWN, "Sexe inconnu"),
+                (self.COLOR_EMPTY, "Case vide"),
+            )
+        else:
+            entries = (
+                (self.COLOR_MALE, "Bloc à majorité d'hommes"),
+                (self.COLOR_FEMALE, "Bloc à majorité de femmes"),
+                (self.COLOR_EMPTY, "Bloc vide (intensité = densité)"),
+            )
+        for color, label in entries:
             item = ttk.Frame(legend)
             item.pack(anchor="w", pady=2, fill="x")
             swatch = tk.Canvas(item, width=18, height=18, highlightthickness=0)
@@ -138,15 +162,59 @@ class SimulationApp:
                 )
                 self._cells[(x, y)] = rect_id
 
+    def _create_lod_image(self) -> None:
+        self._lod_photo: Optional[tk.PhotoImage] = None
+        self._lod_data: Optional[bytes] = None
+        self._lod_image_id = self.canvas.create_image(0, 0, anchor="nw")
+        self._drag_origin: Optional[tuple[int, int]] = None
+
+        # Zoom à la molette (Windows / macOS : MouseWheel, X11 : Button-4/5), déplacement au glisser
+        self.canvas.bind("<MouseWheel>", lambda e: self._on_zoom(e, 1.25 if e.delta > 0 else 0.8))
+        self.canvas.bind("<Button-4>", lambda e: self._on_zoom(e, 1.25))
+        self.canvas.bind("<Button-5>", lambda e: self._on_zoom(e, 0.8))
+        self.canvas.bind("<ButtonPress-1>", self._on_drag_start)
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+
+    def _on_zoom(self, event: tk.Event, facteur: float) -> None:
+        if not self.lod.contient(event.x, event.y):
+            return
+        self.lod.zoomer(facteur, event.x, event.y)
+        self._draw_lod()
+
+    def _on_drag_start(self, event: tk.Event) -> None:
+        # un clic hors de l'image (zone vide du canevas) ne déplace pas la vue
+        self._drag_origin = (event.x, event.y) if self.lod.contient(event.x, event.y) else None
+
+    def _on_drag(self, event: tk.Event) -> None:
+        if self._drag_origin is None:
+            return
+        ox, oy = self._drag_origin
+        self._drag_origin = (event.x, event.y)
+        self.lod.deplacer(event.x - ox, event.y - oy)
+        self._draw_lod()
+
+    def _draw_lod(self) -> None:
+        image = self.lod.image_ppm()
+        if image is self._lod_data:
+            return  # rien n'a changé depuis la dernière image
+        self._lod_data = image
+        self._lod_photo = tk.PhotoImage(data=image, format="PPM")
+        self.canvas.itemconfigure(self._lod_image_id, image=self._lod_photo)
+
     # ---------------------------------------------------------------- Rendering
     def _render_initial_state(self) -> None:
         self._update_cells()
         vivants = self._count_alive()
         self._write_log("=== ÉTAT INITIAL ===\n")
-        self._write_log(self.game.world._to_string() + "\n")
+        self._write_grid()
         self._write_log(f"Vivants: {vivants}\n\n")
 
     def _update_cells(self) -> None:
+        if self.lod is not None:
+            self.lod.mettre_a_jour(*grilles_depuis_monde(self.game.world))
+            self._draw_lod()
+            self.canvas.update_idletasks()
+            return
         for y in range(self.game.world.hauteur):
             for x in range(self.game.world.largeur):
                 humain = self.game.world.grille[y][x]
@@ -165,6 +233,11 @@ class SimulationApp:
     def _status_label(self) -> str:
         return f"Tour {self.current_tour}/{self.max_tours} • Vivants: {self._count_alive()}"
 
+    def _write_grid(self) -> None:
+        # la grille ASCII n'est lisible que pour les petites grilles
+        if self.lod is None:
+            self._write_log(self.game.world._to_string() + "\n")
+
     def _write_log(self, text: str) -> None:
         self.log_text.configure(state="normal")
         self.log_text.insert("end", text)
@@ -188,14 +261,14 @@ class SimulationApp:
         except PopulationDead:
             self._update_cells()
             self.status_var.set(f"Population éteinte au tour {self.current_tour}")
-            self._write_log(self.game.world._to_string() + "\n")
+            self._write_grid()
             self._write_log("Vivants: 0\n")
             return
 
         self._update_cells()
         vivants = self._count_alive()
         self.status_var.set(self._status_label())
-        self._write_log(self.game.world._to_string() + "\n")
+        self._write_grid()
         self._write_log(f"Vivants: {vivants}\n")
 
         if vivants == 0 or self.current_tour >= self.max_tours:
@@ -205,7 +278,7 @@ class SimulationApp:
             self._after_id = self.root.after(self.interval_ms, self._run_next_tick)
 
     def _count_alive(self) -> int:
-        return sum(1 for _ in self.game.world.each_human())
+        return self.game.world.nb_vivants
 
     def _on_close(self) -> None:
         self.running = False
@@ -240,6 +313,11 @@ def parse_args() -> argparse.Namespace:
         default=125,
         help="Seed aléatoire pour reproduire les résultats.",
     )
+    parser.add_argument(
+        "--dense",
+        action="store_true",
+        help="Autorise plusieurs humains par case (rendu agrégé).",
+    )
     return parser.parse_args()
 
 
@@ -252,6 +330,7 @@ def main() -> None:
         tours=args.tours,
         interval_ms=args.interval,
         seed=args.seed,
+        dense=args.dense,
     )
     app.start()
 
@@ -0,0 +1,181 @@
+"""Rendu agrégé (niveau de détail) des grandes grilles pour l'interface Tkinter."""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from Enums.Sex import Sex, SEXE_MALE
+
+
+def _hex_vers_rgb(couleur: str) -> np.ndarray:
+    return np.array([int(couleur[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float64)
+
+
+def grilles_depuis_monde(world) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Retourne deux grilles (hauteur x largeur) : nombre d'humains et nombre
+    d'hommes par case. Accepte un World (un humain par case) ou un MondeDense.
+    """
+    if hasattr(world, "comptes_par_case"):
+        comptes = world.comptes_par_case()
+        cases = world.y * world.largeur + world.x
+        hommes = np.bincount(
+            cases[world.sexe == SEXE_MALE], minlength=world.largeur * world.hauteur
+        ).reshape(world.hauteur, world.largeur)
+        return comptes, hommes
+
+    comptes = np.array([[h is not None for h in ligne] for ligne in world.grille], dtype=np.int64)
+    hommes = np.array(
+        [[h is not None and getattr(h, "sexe", None) == Sex.MALE for h in ligne] for ligne in world.grille],
+        dtype=np.int64,
+    )
+    return comptes, hommes
+
+
+def nb_cases_par_bloc(debuts_y: np.ndarray, debuts_x: np.ndarray) -> np.ndarray:
+    """Nombre de cases couvertes par chaque bloc (au moins une, voir agreger)."""
+    return np.maximum(np.diff(debuts_y), 1)[:, None] * np.maximum(np.diff(debuts_x), 1)[None, :]
+
+
+def agreger(comptes: np.ndarray, hommes: np.ndarray,
+            debuts_y: np.ndarray, debuts_x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Regroupe les cases en blocs : le bloc (i, j) couvre les lignes debuts_y[i] à debuts_y[i+1]
+    (exclu) et les colonnes debuts_x[j] à debuts_x[j+1]. Le dernier début de chaque axe
+    marque la fin de la zone. Deux débuts égaux donnent un bloc d'une seule case
+    (vue zoomée, une case couvre plusieurs pixels).
+    Retourne la densité (humains par case) et la proportion d'hommes de chaque bloc
+    (NaN pour un bloc vide).
+    """
+    # une ligne et une colonne vides en plus : reduceat exige des indices < taille
+    comptes = np.pad(comptes, ((0, 1), (0, 1)))
+    hommes = np.pad(hommes, ((0, 1), (0, 1)))
+    total = np.add.reduceat(np.add.reduceat(comptes, debuts_y, axis=0), debuts_x, axis=1)[:-1, :-1]
+    nb_hommes = np.add.reduceat(np.add.reduceat(hommes, debuts_y, axis=0), debuts_x, axis=1)[:-1, :-1]
+
+    densite = total / nb_cases_par_bloc(debuts_y, debuts_x)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio_hommes = np.where(total > 0, nb_hommes / total, np.nan)
+    return densite, ratio_hommes
+
+
+class RenduLOD:
+    """
+    Transforme l'occupation d'un monde en une seule image PPM adaptée à la taille du canevas.
+    - la vue (x0, y0, zoom) choisit la zone de cases affichée ; le plus grand côté
+      de la vue occupe toujours taille_px pixels (échelle fractionnaire)
+    - chaque pixel agrège les cases qu'il couvre : il est coloré entre COLOR_FEMALE
+      et COLOR_MALE selon la proportion d'hommes, et mélangé à COLOR_EMPTY selon la densité
+    - l'image est gardée en cache tant que la grille et la vue ne changent pas
+    """
+
+    ZOOM_MAX = 64.0  # borné aussi par la taille de la grille : la vue garde au moins une case
+
+    def __init__(self, largeur: int, hauteur: int, taille_px: int,
+                 color_empty: str, color_male: str, color_female: str) -> None:
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.taille_px = taille_px
+        self.zoom = 1.0
+        self.x0 = 0.0
+        self.y0 = 0.0
+        self._vide = _hex_vers_rgb(color_empty)
+        self._homme = _hex_vers_rgb(color_male)
+        self._femme = _hex_vers_rgb(color_female)
+
+        self._grilles: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._cle: Optional[tuple] = None
+        self._image: Optional[bytes] = None
+
+    # ---------------------------------------------------------------- Vue
+    def _vue(self) -> Tuple[float, float]:
+        """Taille de la zone visible en cases (colonnes, lignes) ; recadre x0, y0 dans la grille."""
+        vw = self.largeur / self.zoom
+        vh = self.hauteur / self.zoom
+        self.x0 = min(max(0.0, self.x0), self.largeur - vw)
+        self.y0 = min(max(0.0, self.y0), self.hauteur - vh)
+        return vw, vh
+
+    def px_par_case(self) -> float:
+        """Échelle de l'image : nombre de pixels par côté de case (fractionnaire)."""
+        vw, vh = self._vue()
+        return self.taille_px / max(vw, vh)
+
+    def taille_image(self) -> Tuple[int, int]:
+        """Taille de l'image en pixels (largeur, hauteur)."""
+        vw, vh = self._vue()
+        s = self.px_par_case()
+        return max(1, min(self.taille_px, round(vw * s))), max(1, min(self.taille_px, round(vh * s)))
+
+    def contient(self, px: float, py: float) -> bool:
+        """Le pixel (px, py) du canevas est-il sur l'image ?"""
+        w, h = self.taille_image()
+        return 0 <= px < w and 0 <= py < h
+
+    def zoomer(self, facteur: float, px: float = 0.0, py: float = 0.0) -> None:
+        """Zoome en gardant fixe la case sous le pixel (px, py)."""
+        s = self.px_par_case()
+        cx, cy = self.x0 + px / s, self.y0 + py / s
+        zoom_max = min(self.ZOOM_MAX, min(self.largeur, self.hauteur))
+        self.zoom = min(zoom_max, max(1.0, self.zoom * facteur))
+        s = self.px_par_case()
+        self.x0, self.y0 = cx - px / s, cy - py / s
+        self._vue()
+
+    def deplacer(self, dx_px: float, dy_px: float) -> None:
+        """Fait glisser la vue de (dx_px, dy_px) pixels."""
+        s = self.px_par_case()
+        self.x0 -= dx_px / s
+        self.y0 -= dy_px / s
+        self._vue()
+
+    # ---------------------------------------------------------------- Image
+    def mettre_a_jour(self, comptes: np.ndarray, hommes: np.ndarray) -> bool:
+        """Enregistre l'état de la grille. Retourne True s'il a changé depuis le dernier appel."""
+        if self._grilles is not None and np.array_equal(self._grilles[0], comptes) \
+                and np.array_equal(self._grilles[1], hommes):
+            return False
+        self._grilles = (comptes.copy(), hommes.copy())
+        self._image = None
+        return True
+
+    def _debuts(self, origine: float, nb_px: int, s: float, vue: float, limite: int) -> np.ndarray:
+        """Première case couverte par chaque pixel d'un axe, suivie de la fin de la zone."""
+        bords = np.floor(origine + np.arange(nb_px + 1) / s).astype(np.int64)
+        # la fin est calculée à part : l'arrondi flottant de origine + nb_px / s
+        # peut tomber une case trop tôt et faire disparaître la dernière ligne/colonne
+        fin = min(int(np.ceil(origine + vue)), limite)
+        bords[-1] = fin
+        return np.minimum(bords, fin)
+
+    def image_ppm(self) -> bytes:
+        """Image PPM (P6) de la vue courante, recalculée seulement si la grille ou la vue a changé."""
+        if self._grilles is None:
+            raise RuntimeError("mettre_a_jour() doit être appelé avant image_ppm()")
+        self._vue()
+        cle = (self.x0, self.y0, self.zoom)
+        if self._image is not None and cle == self._cle:
+            return self._image
+
+        vw, vh = self._vue()
+        s = self.px_par_case()
+        w, h = self.taille_image()
+        debuts_x = self._debuts(self.x0, w, s, vw, self.largeur)
+        debuts_y = self._debuts(self.y0, h, s, vh, self.hauteur)
+        comptes, hommes = self._grilles
+        densite, ratio = agreger(comptes, hommes, debuts_y, debuts_x)
+
+        if s <= 1:
+            # vue dézoomée, chaque case visible est dans exactement un pixel :
+            # chaque humain de la zone visible doit être compté une fois
+            visibles = comptes[debuts_y[0]:debuts_y[-1], debuts_x[0]:debuts_x[-1]].sum()
+            assert np.isclose((densite * nb_cases_par_bloc(debuts_y, debuts_x)).sum(), visibles)
+
+        densite_max = densite.max(initial=0.0)
+        intensite = (densite / densite_max if densite_max > 0 else densite)[..., None]
+        ratio = np.nan_to_num(ratio, nan=0.5)[..., None]
+        teinte = ratio * self._homme + (1.0 - ratio) * self._femme
+        rgb = (intensite * teinte + (1.0 - intensite) * self._vide).astype(np.uint8)
+
+        self._image = f"P6 {w} {h} 255 ".encode() + rgb.tobytes()
+        self._cle = cle
+        return self._image
@@ -0,0 +1,217 @@
+# Models/ensemble.py
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .Humain import Humain
+from .World import World
+from Enums.Sex import SEXE_MALE, SEXE_FEMALE, SEXE_VERS_CODE, CODE_VERS_SEXE
+from Enums.Direction import Direction
+
+# Les 8 déplacements possibles ; l'indice 8 représente Direction.IMMOBILE
+DIRECTIONS_MOUVEMENT: List[Direction] = [
+    Direction.GAUCHE, Direction.DROITE, Direction.HAUT, Direction.BAS,
+    Direction.HAUT_GAUCHE, Direction.HAUT_DROITE, Direction.BAS_GAUCHE, Direction.BAS_DROITE,
+]
+IMMOBILE = len(DIRECTIONS_MOUVEMENT)
+
+
+class Ensemble:
+    """
+    B mondes indépendants empilés dans des tableaux (B x hauteur x largeur).
+    Chaque case contient au plus un humain : ses attributs sont stockés
+    directement dans la case (âge, durée de vie, proba de procréer, sexe).
+    - tick(): avance tous les mondes avec les mêmes règles que World.tick
+    - l'extinction d'un monde est notée dans tour_extinction au lieu de lever PopulationDead
+    """
+
+    def __init__(self, nb_mondes: int, width: int, height: int, seed: Optional[int] = 42):
+        """Crée nb_mondes grilles vides de taille (width x height)."""
+        self.nb_mondes = nb_mondes
+        self.largeur = width
+        self.hauteur = height
+        self.rng = np.random.default_rng(seed)
+        self.tour = 0
+
+        forme = (nb_mondes, height, width)
+        self.occupe = np.zeros(forme, dtype=bool)
+        self.age = np.zeros(forme, dtype=np.int32)
+        self.duree_vie = np.zeros(forme, dtype=np.int32)
+        self.proba_procreer = np.zeros(forme, dtype=np.float64)
+        self.sexe = np.zeros(forme, dtype=np.int8)
+        # identifiant de l'humain dans son monde (ordre de création), valide là où occupe est vrai
+        self.ident = np.full(forme, -1, dtype=np.int64)
+
+        # Statistiques par monde
+        self.tour_extinction = np.full(nb_mondes, -1, dtype=np.int64)
+        self.morts = np.zeros(nb_mondes, dtype=np.int64)
+        self.deplacements = np.zeros(nb_mondes, dtype=np.int64)
+        self.conflits = np.zeros(nb_mondes, dtype=np.int64)
+
+    # ---------- construction ----------
+    @classmethod
+    def depuis_mondes(cls, mondes: Sequence[World], seed: Optional[int] = 42) -> "Ensemble":
+        """Empile des World existants (tous de même taille) dans un Ensemble."""
+        if not mondes:
+            raise ValueError("Il faut au moins un monde")
+        largeur, hauteur = mondes[0].largeur, mondes[0].hauteur
+        if any(m.largeur != largeur or m.hauteur != hauteur for m in mondes):
+            raise ValueError("Tous les mondes doivent avoir la même taille")
+
+        ens = cls(len(mondes), largeur, hauteur, seed=seed)
+        for b, monde in enumerate(mondes):
+            for i, h in enumerate(monde.each_human()):
+                x, y = h.coordoneeX, h.coordoneeY
+                ens.ident[b, y, x] = i
+                ens.occupe[b, y, x] = True
+                ens.age[b, y, x] = h.age
+                ens.duree_vie[b, y, x] = h.duree_vie
+                ens.proba_procreer[b, y, x] = h.proba_procreer
+                ens.sexe[b, y, x] = SEXE_VERS_CODE[h.sexe]
+        return ens
+
+    def vers_monde(self, b: int) -> World:
+        """Reconstruit le World d'indice b (utile pour l'affichage ou la comparaison)."""
+        monde = World(self.largeur, self.hauteur)
+        for y, x in zip(*np.nonzero(self.occupe[b])):
+            h = Humain(
+                age=int(self.age[b, y, x]),
+                duree_vie=int(self.duree_vie[b, y, x]),
+                proba_procreer=float(self.proba_procreer[b, y, x]),
+                vivant=True,
+                sexe=CODE_VERS_SEXE[int(self.sexe[b, y, x])],
+            )
+            monde.place_at(int(x), int(y), h)
+            monde.humans.append(h)
+        return monde
+
+    def remplir_grilles(self, nb_humains: int, male_ratio: float = 0.5) -> np.ndarray:
+        """
+        Ajoute nb_humains dans chaque monde, sur des cases vides aléatoires,
+        avec les mêmes tirages que World.remplir_grille.
+        Un monde trop plein est rempli jusqu'à sa dernière case libre.
+        Retourne le nombre d'humains placés par monde (tableau de taille B).
+        """
+        B, H, W = self.occupe.shape
+        libres = (~self.occupe).reshape(B, H * W)
+        places = np.minimum(max(0, nb_humains), libres.sum(axis=1))
+        n_max = int(places.max(initial=0))
+        if n_max == 0:
+            return places
+
+        # les cases occupées reçoivent une clé infinie pour passer après les cases libres
+        cles = self.rng.random((B, H * W))
+        cles[~libres] = np.inf
+        ordre = np.argsort(cles, axis=1)[:, :n_max]
+        garde = np.arange(n_max) < places[:, None]
+        mondes, rangs = np.nonzero(garde)
+        ys, xs = np.divmod(ordre[garde], W)
+        n = len(mondes)
+
+        deja_places = self.occupe.sum(axis=(1, 2))
+        self.ident[mondes, ys, xs] = deja_places[mondes] + rangs
+        self.occupe[mondes, ys, xs] = True
+        self.sexe[mondes, ys, xs] = np.where(
+            self.rng.random(n) < male_ratio, SEXE_MALE, SEXE_FEMALE
+        )
+        self.age[mondes, ys, xs] = self.rng.integers(20, 60, size=n, endpoint=True)
+        self.duree_vie[mondes, ys, xs] = self.rng.integers(60, 80, size=n, endpoint=True)
+        self.proba_procreer[mondes, ys, xs] = self.rng.uniform(0.05, 0.30, size=n)
+        return places
+
+    # ---------- statistiques ----------
+    def vivants(self) -> np.ndarray:
+        """Nombre d'humains vivants par monde."""
+        return self.occupe.sum(axis=(1, 2))
+
+    def eteints(self) -> np.ndarray:
+        """Masque des mondes dont la population est morte."""
+        return self.tour_extinction >= 0
+
+    def statistiques(self) -> Dict[str, np.ndarray]:
+        """Statistiques par monde (un tableau de taille B par clé)."""
+        return {
+            "vivants": self.vivants(),
+            "hommes": (self.occupe & (self.sexe == SEXE_MALE)).sum(axis=(1, 2)),
+            "femmes": (self.occupe & (self.sexe == SEXE_FEMALE)).sum(axis=(1, 2)),
+            "morts": self.morts.copy(),
+            "deplacements": self.deplacements.copy(),
+            "conflits": self.conflits.copy(),
+            "tour_extinction": self.tour_extinction.copy(),
+        }
+
+    # ---------- tick ----------
+    def _decaler(self, tableau: np.ndarray, dx: int, dy: int) -> np.ndarray:
+        """Décale les grilles de (dx, dy) avec l'effet torus : la case (x,y) va en (x+dx, y+dy)."""
+        return np.roll(tableau, shift=(dy, dx), axis=(1, 2))
+
+    def tick(self) -> None:
+        """
+        Même règle que World.tick, appliquée à tous les mondes à la fois :
+        1) vieillissement, les morts quittent la grille
+        2) chaque humain parcourt les directions dans un ordre aléatoire et
+           vise la première case vide, ou reste sur place s'il tombe sur IMMOBILE
+        3) une case visée par plusieurs humains est attribuée uniformément au hasard
+        4) les gagnants se déplacent simultanément
+        Un monde sans vivant est marqué dans tour_extinction (pas d'exception).
+        """
+        self.tour += 1
+
+        # --- 1) Vieillissement + suppression des morts ---
+        self.age[self.occupe] += 1
+        meurent = self.occupe & (self.age >= self.duree_vie)
+        self.morts += meurent.sum(axis=(1, 2))
+        self.occupe &= ~meurent
+
+        vivants = self.vivants()
+        nouveaux_eteints = (vivants == 0) & (self.tour_extinction < 0)
+        self.tour_extinction[nouveaux_eteints] = self.tour
+        if not vivants.any():
+            return
+
+        # --- 2) Intentions ---
+        # Tirer une permutation des 9 directions et prendre la première valide
+        # revient à prendre la clé aléatoire minimale parmi IMMOBILE et les cases vides.
+        vide = ~self.occupe
+        cles = self.rng.random(self.occupe.shape + (IMMOBILE + 1,))
+        for i, d in enumerate(DIRECTIONS_MOUVEMENT):
+            cible_vide = self._decaler(vide, -d.dx, -d.dy)
+            cles[..., i][~cible_vide] = np.inf
+        choix = cles.argmin(axis=-1)
+        choix[~self.occupe] = IMMOBILE
+
+        # --- 3) Conflits : un gagnant uniforme par case ---
+        # arrivees[..., i] : la case reçoit un candidat venant par la direction i
+        arrivees = np.stack(
+            [self._decaler(choix == i, d.dx, d.dy) for i, d in enumerate(DIRECTIONS_MOUVEMENT)],
+            axis=-1,
+        )
+        priorites = self.rng.random(arrivees.shape)
+        priorites[~arrivees] = -1.0
+        direction_gagnante = priorites.argmax(axis=-1)
+        nb_candidats = arrivees.sum(axis=-1)
+        a_un_gagnant = nb_candidats > 0
+
+        self.deplacements += a_un_gagnant.sum(axis=(1, 2))
+        self.conflits += (nb_candidats > 1).sum(axis=(1, 2))
+
+        # --- 4) Application simultanée ---
+        # Les cibles sont vides et les origines occupées : les deux ensembles sont disjoints.
+        attributs = (self.age, self.duree_vie, self.proba_procreer, self.sexe, self.ident)
+        for i, d in enumerate(DIRECTIONS_MOUVEMENT):
+            destinations = a_un_gagnant & (direction_gagnante == i)
+            if not destinations.any():
+                continue
+            origines = self._decaler(destinations, -d.dx, -d.dy)
+            for tableau in attributs:
+                tableau[destinations] = self._decaler(tableau, d.dx, d.dy)[destinations]
+            self.occupe[origines] = False
+            self.occupe[destinations] = True
+
+    def run(self, tours: int) -> Dict[str, np.ndarray]:
+        """Avance tous les mondes pendant `tours` ticks (arrêt anticipé si tous sont éteints)."""
+        for _ in range(tours):
+            if self.eteints().all():
+                break
+            self.tick()
+        return self.statistiques()
@@ -0,0 +1,161 @@
+# Models/monde_dense.py
+from typing import Iterator, Optional
+
+import numpy as np
+
+from .Humain import Humain
+from .World import PopulationDead
+from Enums.Direction import Direction
+from Enums.Sex import SEXE_MALE, SEXE_FEMALE, CODE_VERS_SEXE
+
+
+class MondeDense:
+    """
+    Grille 2D où une case peut contenir plusieurs humains (villes, foules...).
+    Les humains sont stockés en colonnes (un tableau numpy par attribut) et
+    l'occupation des cases est indexée dans un format de type CSR :
+    - comptes[c]  : nombre d'humains dans la case c = y * largeur + x
+    - debuts[c]   : début de la case c dans `indices` (debuts[c+1] = fin)
+    - indices     : indices des humains triés par case
+    Cet index est reconstruit à chaque tick : comptes par bincount, debuts par
+    somme cumulée, indices par un tri stable du numéro de case (tri par base,
+    linéaire, tant que la grille a au plus 65536 cases).
+    Comme il n'y a pas de limite par case, le déplacement est une simple
+    écriture des nouvelles positions : pas de résolution de conflits.
+    """
+
+    def __init__(self, width: int, height: int, seed: Optional[int] = 42):
+        """Crée une grille vide de taille (width x height)."""
+        self.largeur = width
+        self.hauteur = height
+        self.rng = np.random.default_rng(seed)
+
+        self.x = np.zeros(0, dtype=np.int64)
+        self.y = np.zeros(0, dtype=np.int64)
+        self.age = np.zeros(0, dtype=np.int32)
+        self.duree_vie = np.zeros(0, dtype=np.int32)
+        self.proba_procreer = np.zeros(0, dtype=np.float64)
+        self.sexe = np.zeros(0, dtype=np.int8)
+
+        self._indexer()
+
+    # ---------- index CSR ----------
+    def _indexer(self) -> None:
+        """Reconstruit comptes / debuts / indices à partir du numéro de case de chaque humain."""
+        nb_cases = self.largeur * self.hauteur
+        cases = self.y * self.largeur + self.x
+        self.comptes = np.bincount(cases, minlength=nb_cases)
+        self.debuts = np.zeros(nb_cases + 1, dtype=np.int64)
+        np.cumsum(self.comptes, out=self.debuts[1:])
+        # numpy fait un tri par base (radix) sur les clés de 16 bits ou moins,
+        # sinon un tri fusion stable en O(n log n)
+        if nb_cases <= 1 << 16:
+            cases = cases.astype(np.uint16)
+        self.indices = np.argsort(cases, kind="stable")
+
+    def comptes_par_case(self) -> np.ndarray:
+        """Nombre d'humains par case, sous forme de grille (hauteur x largeur)."""
+        return self.comptes.reshape(self.hauteur, self.largeur)
+
+    def humains_sur_case(self, x: int, y: int) -> np.ndarray:
+        """Indices des humains présents sur la case (x, y)."""
+        c = y * self.largeur + x
+        return self.indices[self.debuts[c]:self.debuts[c + 1]]
+
+    # ---------- population ----------
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def nb_vivants(self) -> int:
+        """Nombre d'humains vivants."""
+        return len(self.x)
+
+    def remplir_grille(self, nb_humains: int, male_ratio: float = 0.5) -> int:
+        """
+        Ajoute nb_humains à des positions aléatoires (plusieurs par case possibles),
+        avec les mêmes tirages que World.remplir_grille.
+        Retourne le nombre d'humains placés.
+        """
+        n = max(0, nb_humains)
+        rng = self.rng
+        self.x = np.concatenate([self.x, rng.integers(0, self.largeur, size=n)])
+        self.y = np.concatenate([self.y, rng.integers(0, self.hauteur, size=n)])
+        self.sexe = np.concatenate(
+            [self.sexe, np.where(rng.random(n) < male_ratio, SEXE_MALE, SEXE_FEMALE).astype(np.int8)]
+        )
+        self.age = np.concatenate([self.age, rng.integers(20, 60, size=n, endpoint=True).astype(np.int32)])
+        self.duree_vie = np.concatenate(
+            [self.duree_vie, rng.integers(60, 80, size=n, endpoint=True).astype(np.int32)]
+        )
+        self.proba_procreer = np.concatenate([self.proba_procreer, rng.uniform(0.05, 0.30, size=n)])
+        self._indexer()
+        return n
+
+    def _garder(self, masque: np.ndarray) -> None:
+        """Ne conserve que les humains sélectionnés par `masque`."""
+        self.x = self.x[masque]
+        self.y = self.y[masque]
+        self.age = self.age[masque]
+        self.duree_vie = self.duree_vie[masque]
+        self.proba_procreer = self.proba_procreer[masque]
+        self.sexe = self.sexe[masque]
+
+    # + utilitaire
+    def each_human(self) -> Iterator[Humain]:
+        """Parcourt les humains case par case (copies Humain, pour l'affichage)."""
+        for i in self.indices:
+            yield Humain(
+                age=int(self.age[i]),
+                duree_vie=int(self.duree_vie[i]),
+                proba_procreer=float(self.proba_procreer[i]),
+                vivant=True,
+                sexe=CODE_VERS_SEXE[int(self.sexe[i])],
+                coordoneeX=int(self.x[i]),
+                coordoneeY=int(self.y[i]),
+            )
+
+    def _to_string(self) -> str:
+        """
+        Représentation ASCII de la grille :
+        - nombre d'humains dans la case ('0' si vide)
+        - '|' pour les colonnes, lignes horizontales en '-'
+        """
+        comptes = self.comptes_par_case()
+        largeur_case = max(3, len(str(int(comptes.max(initial=0)))) + 2)
+        hline = "-" * (self.largeur * (largeur_case + 1) + 1)
+        lines = [hline]
+        for y in range(self.hauteur):
+            row = "|" + "|".join(f"{int(n)}".center(largeur_case) for n in comptes[y]) + "|"
+            lines.append(row)
+            lines.append(hline)
+        return "\n".join(lines)
+
+    # ---------- tick ----------
+    def tick(self) -> None:
+        """
+        1) vieillissement, les morts sont retirés
+        2) chaque humain tire une direction uniforme parmi les 9 (IMMOBILE compris)
+        3) les nouvelles positions sont écrites directement (torus), sans conflit
+        4) l'index CSR est reconstruit
+        """
+        # --- 1) Vieillissement + suppression des morts ---
+        self.age += 1
+        self._garder(self.age < self.duree_vie)
+
+        if len(self) == 0:
+            self._indexer()
+            print("Toute la population est morte.")
+            raise PopulationDead()
+
+        # --- 2) Directions (les 9, IMMOBILE compris) ---
+        dxs = np.array([d.dx for d in Direction])
+        dys = np.array([d.dy for d in Direction])
+        choix = self.rng.integers(0, len(dxs), size=len(self))
+
+        # --- 3) Déplacement simultané ---
+        self.x = (self.x + dxs[choix]) % self.largeur
+        self.y = (self.y + dys[choix]) % self.hauteur
+
+        # --- 4) Index par case ---
+        self._indexer()
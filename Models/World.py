@@ -168,6 +168,11 @@ class World:
         return True
 
     
+    @property
+    def nb_vivants(self) -> int:
+        """Nombre d'humains vivants (tenu à jour par le placement et le vieillissement)."""
+        return len(self.humans)
+
     # + utilitaire
     def each_human(self):   
         for y in range(self.hauteur):